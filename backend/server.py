@@ -1,21 +1,164 @@
+import asyncio
+import base64
+import json
 import os
 import uuid
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException, status
+from fastapi import Body, FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from pymongo import MongoClient
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, field_serializer
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.collation import Collation
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
+from cachetools import TTLCache
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Database connection
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DB_NAME = os.environ.get('DB_NAME', 'ecommerce_db')
+# uvicorn reads WEB_CONCURRENCY for --workers too, so every process resolves the same count
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+# Each worker opens its own pool, so the defaults split a 50/10 connection budget across workers;
+# explicit MONGO_*_POOL_SIZE values are per worker
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', max(50 // WEB_CONCURRENCY, 5)))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', max(10 // WEB_CONCURRENCY, 1)))
+HEALTH_CHECK_TIMEOUT = 1.0
+MAX_BULK_PRODUCTS = 1000
+ID_MIGRATION_BATCH_SIZE = 1000
+DUPLICATE_KEY_ERROR_CODE = 11000
+# Case-insensitive comparison for category lookups
+CATEGORY_COLLATION = Collation(locale="en", strength=2)
+
+# Cache connection
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+CACHE_PREFIX = "ecom"
+PRODUCT_CACHE_TTL = 300
+PRODUCT_LIST_CACHE_TTL = 60
+LOCAL_PRODUCT_CACHE_SIZE = 10_000
+LOCAL_PRODUCT_CACHE_TTL = 60
+
+# A write only evicts the local tier of the worker that handled it, so it is only safe with one worker
+LOCAL_PRODUCT_CACHE_ENABLED = WEB_CONCURRENCY == 1
+
+# Worker-local tier in front of Redis for single-product lookups
+_product_cache = TTLCache(maxsize=LOCAL_PRODUCT_CACHE_SIZE, ttl=LOCAL_PRODUCT_CACHE_TTL)
+
+# Populated in lifespan so the clients bind to the running event loop
+client = None
+db = None
+products_collection = None
+redis_client = None
+
+async def migrate_legacy_product_ids():
+    """Rewrite product ids stored as strings into the binary UUIDs queries now use"""
+    migrated = 0
+    updates = []
+    async for product in products_collection.find({"id": {"$type": "string"}}, {"id": 1}):
+        try:
+            product_uuid = uuid.UUID(product["id"])
+        except ValueError:
+            logger.warning(f"Skipping product {product['_id']} with non-UUID id {product['id']!r}")
+            continue
+        # Matching on the old value keeps concurrent workers from migrating a document twice
+        updates.append(UpdateOne({"_id": product["_id"], "id": product["id"]}, {"$set": {"id": product_uuid}}))
+        if len(updates) == ID_MIGRATION_BATCH_SIZE:
+            await products_collection.bulk_write(updates, ordered=False)
+            migrated += len(updates)
+            updates = []
+    if updates:
+        await products_collection.bulk_write(updates, ordered=False)
+        migrated += len(updates)
+    if migrated:
+        logger.info(f"Migrated {migrated} product ids to binary UUIDs")
+
+async def ensure_indexes():
+    """Create the indexes backing product lookups, listings and category filters"""
+    await products_collection.create_index("id", unique=True)
+    await products_collection.create_index([("created_at", -1), ("id", -1)])
+    await products_collection.create_index(
+        [("category", 1), ("created_at", -1), ("id", -1)],
+        collation=CATEGORY_COLLATION
+    )
+
+def product_list_version_key() -> str:
+    """Redis key of the counter that versions every cached listing"""
+    return f"{FastAPICache.get_prefix()}:products:version"
+
+async def product_cache_key_builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None) -> str:
+    """Build readable cache keys from an endpoint's path and query parameters"""
+    # fastapi-cache2 0.2.1 passes the bare namespace, so the prefix is added here
+    prefix = FastAPICache.get_prefix()
+    params = ":".join(f"{name}={value}" for name, value in sorted((kwargs or {}).items()))
+    if namespace.startswith("products"):
+        # Listing keys carry the list version, so a write expires them all with one INCR
+        try:
+            version = await redis_client.get(product_list_version_key())
+            version = version.decode() if version else "0"
+        except RedisError as e:
+            logger.warning(f"Cache read failed for {product_list_version_key()}: {e}")
+            # A one-off version forces a miss rather than risking a stale listing
+            version = uuid.uuid4().hex
+        return f"{prefix}:{namespace}:v{version}:{params}"
+    return f"{prefix}:{namespace}:{params}"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the MongoDB connection pool on startup and close it on shutdown"""
+    global client, db, products_collection, redis_client
+    try:
+        client = AsyncIOMotorClient(
+            MONGO_URL,
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=60000,
+            serverSelectionTimeoutMS=3000,
+            uuidRepresentation="standard",
+            tz_aware=True,
+            connect=True
+        )
+        db = client[DB_NAME]
+        products_collection = db.products
+        # Ping so the pool starts filling before the first request arrives
+        await client.admin.command('ping')
+        # Every worker runs these at startup; both are idempotent, so concurrent runs are safe
+        await migrate_legacy_product_ids()
+        await ensure_indexes()
+        logger.info(f"Connected to MongoDB at {MONGO_URL}")
+    except Exception as e:
+        logger.error(f"Failed to connect to MongoDB: {e}")
+        raise
+
+    redis_client = Redis.from_url(REDIS_URL, decode_responses=False)
+    FastAPICache.init(
+        RedisBackend(redis_client),
+        prefix=CACHE_PREFIX,
+        key_builder=product_cache_key_builder
+    )
+
+    yield
+
+    await redis_client.aclose()
+    client.close()
+
 app = FastAPI(
     title="E-commerce API",
     description="A comprehensive RESTful API for e-commerce product management",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -27,18 +170,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Database connection
-MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
-DB_NAME = os.environ.get('DB_NAME', 'ecommerce_db')
-
-try:
-    client = MongoClient(MONGO_URL)
-    db = client[DB_NAME]
-    products_collection = db.products
-    logger.info(f"Connected to MongoDB at {MONGO_URL}")
-except Exception as e:
-    logger.error(f"Failed to connect to MongoDB: {e}")
-    raise
+@app.middleware("http")
+async def disable_client_caching(request: Request, call_next):
+    """Stop browsers reusing product reads that a later write has invalidated"""
+    response = await call_next(request)
+    # fastapi-cache2 advertises max-age on cached responses, which would outlive server-side invalidation
+    if request.method == "GET" and request.url.path.startswith("/api/products"):
+        response.headers["Cache-Control"] = "no-store"
+    return response
 
 # Pydantic models
 class ProductBase(BaseModel):
@@ -61,24 +200,82 @@ class ProductUpdate(BaseModel):
     image_url: Optional[str] = None
 
 class Product(ProductBase):
-    id: str = Field(..., description="Unique product identifier")
+    id: uuid.UUID = Field(..., description="Unique product identifier")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
+    @field_serializer("created_at", "updated_at")
+    def serialize_timestamp(self, value: datetime) -> str:
+        """Match the isoformat() output of reads, which skip the model"""
+        return value.isoformat()
+
+class ProductPage(BaseModel):
+    items: List[Product] = Field(..., description="Products on this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (null on the last page)")
+    total: Optional[int] = Field(None, description="Total number of matching products (first page only)")
+
+# Fields returned to clients, so documents come back from MongoDB already in Product shape
+PRODUCT_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "name": 1,
+    "description": 1,
+    "price": 1,
+    "category": 1,
+    "stock_quantity": 1,
+    "image_url": 1,
+    "created_at": 1,
+    "updated_at": 1
+}
+
 # Helper functions
-def product_helper(product) -> dict:
-    """Convert MongoDB document to Product dict"""
-    return {
-        "id": product["id"],
-        "name": product["name"],
-        "description": product["description"],
-        "price": product["price"],
-        "category": product["category"],
-        "stock_quantity": product["stock_quantity"],
-        "image_url": product.get("image_url"),
-        "created_at": product["created_at"],
-        "updated_at": product["updated_at"]
-    }
+def utc_now() -> datetime:
+    """Current UTC time truncated to the millisecond precision MongoDB stores"""
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+def encode_cursor(product: dict) -> str:
+    """Encode a product's sort position as an opaque page cursor"""
+    position = json.dumps([product["created_at"].isoformat(), str(product["id"])])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+def decode_cursor(cursor: str):
+    """Decode a page cursor into the created_at and id it points after"""
+    try:
+        created_at, product_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(product_id)
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+def parse_product_id(product_id: str) -> uuid.UUID:
+    """Convert a product id from the URL into the UUID stored in MongoDB"""
+    try:
+        return uuid.UUID(product_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Product with id {product_id} not found"
+        )
+
+async def invalidate_product_cache(product_id: Optional[uuid.UUID] = None):
+    """Drop the cached product and every cached listing"""
+    if product_id:
+        _product_cache.pop(str(product_id), None)
+    try:
+        if product_id:
+            await redis_client.delete(f"{FastAPICache.get_prefix()}:product:product_id={product_id}")
+        # Bumping the version orphans old listing keys until their TTL runs out
+        await redis_client.incr(product_list_version_key())
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed for product {product_id}: {e}")
+
+@cache(expire=PRODUCT_CACHE_TTL, namespace="product")
+async def fetch_product(product_id: str):
+    """Load a product from the Redis cache, falling back to MongoDB"""
+    return await products_collection.find_one({"id": parse_product_id(product_id)}, PRODUCT_PROJECTION)
 
 # API Endpoints
 
@@ -99,10 +296,15 @@ async def root():
 async def health_check():
     """Health check endpoint"""
     try:
-        # Test database connection
-        db.command('ping')
+        # Test database connection without letting a slow server stall the check
+        await asyncio.wait_for(db.command('ping'), timeout=HEALTH_CHECK_TIMEOUT)
         return {"status": "healthy", "database": "connected"}
-    except Exception as e:
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database connection failed: ping timed out"
+        )
+    except PyMongoError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Database connection failed: {str(e)}"
@@ -111,73 +313,165 @@ async def health_check():
 @app.post("/api/products", response_model=Product, status_code=status.HTTP_201_CREATED, tags=["Products"])
 async def create_product(product: ProductCreate):
     """Create a new product"""
+    current_time = utc_now()
     try:
-        product_id = str(uuid.uuid4())
-        current_time = datetime.utcnow()
+        product_id = uuid.uuid4()
         
-        product_dict = product.dict()
+        product_dict = product.model_dump()
         product_dict.update({
             "id": product_id,
             "created_at": current_time,
             "updated_at": current_time
         })
         
-        result = products_collection.insert_one(product_dict)
+        result = await products_collection.insert_one(product_dict)
         
         if result.inserted_id:
-            created_product = products_collection.find_one({"id": product_id})
-            return product_helper(created_product)
+            await invalidate_product_cache()
+            return product_dict
         else:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create product"
             )
-    except Exception as e:
+    except DuplicateKeyError as e:
+        logger.error(f"Error creating product: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Product with this id already exists"
+        )
+    except PyMongoError as e:
         logger.error(f"Error creating product: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create product: {str(e)}"
         )
 
-@app.get("/api/products", response_model=List[Product], tags=["Products"])
-async def get_products(skip: int = 0, limit: int = 50, category: Optional[str] = None):
-    """Get all products with optional filtering and pagination"""
+@app.post("/api/products/bulk", response_model=List[Product], status_code=status.HTTP_201_CREATED, tags=["Products"])
+async def create_products_bulk(products: List[ProductCreate] = Body(..., max_length=MAX_BULK_PRODUCTS)):
+    """Create several products in a single database round-trip"""
+    current_time = utc_now()
+    try:
+        if not products:
+            return []
+        
+        product_dicts = []
+        for product in products:
+            product_dict = product.model_dump()
+            product_dict.update({
+                "id": uuid.uuid4(),
+                "created_at": current_time,
+                "updated_at": current_time
+            })
+            product_dicts.append(product_dict)
+        
+        await products_collection.insert_many(product_dicts, ordered=False)
+        await invalidate_product_cache()
+        return product_dicts
+    except BulkWriteError as e:
+        # Unordered inserts carry on past failures, so part of the batch may already be stored
+        await invalidate_product_cache()
+        write_errors = e.details["writeErrors"]
+        failed_indexes = {error["index"] for error in write_errors}
+        logger.error(f"Error creating products in bulk: {len(write_errors)} of {len(product_dicts)} failed")
+        all_duplicates = all(error["code"] == DUPLICATE_KEY_ERROR_CODE for error in write_errors)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT if all_duplicates else status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "message": "Some products could not be created",
+                "inserted_count": e.details["nInserted"],
+                "created_ids": [
+                    str(product_dict["id"])
+                    for index, product_dict in enumerate(product_dicts)
+                    if index not in failed_indexes
+                ],
+                "errors": [{"index": error["index"], "message": error["errmsg"]} for error in write_errors]
+            }
+        )
+    except PyMongoError as e:
+        logger.error(f"Error creating products in bulk: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create products: {str(e)}"
+        )
+
+# Reads return documents this service validated on write, so they skip response validation;
+# the models are kept in `responses` for the OpenAPI schema.
+@app.get("/api/products", response_model=None, responses={200: {"model": ProductPage}}, tags=["Products"])
+@cache(expire=PRODUCT_LIST_CACHE_TTL, namespace="products")
+async def get_products(
+    skip: int = 0,
+    limit: int = Query(50, ge=0),
+    category: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+    """Get all products with optional filtering and cursor-based pagination"""
     try:
         query = {}
+        collation = None
         if category:
-            query["category"] = {"$regex": category, "$options": "i"}
+            query["category"] = category
+            collation = CATEGORY_COLLATION
         
-        products = list(
-            products_collection.find(query)
+        # Count once per listing rather than per page, so later keyset pages stay O(limit);
+        # unfiltered totals come from collection metadata instead of a full count
+        total = None
+        if cursor is None:
+            if category:
+                total = await products_collection.count_documents(query, collation=collation)
+            else:
+                total = await products_collection.estimated_document_count()
+        
+        # Seek past the last product of the previous page instead of skipping over it
+        if cursor:
+            last_created_at, last_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": last_created_at}},
+                {"created_at": last_created_at, "id": {"$lt": last_id}}
+            ]
+        
+        products_cursor = (
+            products_collection.find(query, PRODUCT_PROJECTION, collation=collation)
             .skip(skip)
             .limit(limit)
-            .sort("created_at", -1)
+            .sort([("created_at", -1), ("id", -1)])
+            .batch_size(limit)
         )
         
-        return [product_helper(product) for product in products]
-    except Exception as e:
+        products = await products_cursor.to_list(length=None)
+        next_cursor = encode_cursor(products[-1]) if limit and len(products) == limit else None
+        return {"items": products, "next_cursor": next_cursor, "total": total}
+    except PyMongoError as e:
         logger.error(f"Error fetching products: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch products: {str(e)}"
         )
 
-@app.get("/api/products/{product_id}", response_model=Product, tags=["Products"])
+@app.get("/api/products/{product_id}", response_model=None, responses={200: {"model": Product}}, tags=["Products"])
 async def get_product(product_id: str):
     """Get a specific product by ID"""
+    # Canonical form, so every spelling of the UUID shares the keys invalidate_product_cache drops
+    product_key = str(parse_product_id(product_id))
+    if LOCAL_PRODUCT_CACHE_ENABLED:
+        product = _product_cache.get(product_key)
+        if product is not None:
+            return product
+    
     try:
-        product = products_collection.find_one({"id": product_id})
+        # Called with a keyword so the Redis key matches invalidate_product_cache
+        product = await fetch_product(product_id=product_key)
         
         if product:
-            return product_helper(product)
+            if LOCAL_PRODUCT_CACHE_ENABLED:
+                _product_cache[product_key] = product
+            return product
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Product with id {product_id} not found"
             )
-    except HTTPException:
-        raise
-    except Exception as e:
+    except PyMongoError as e:
         logger.error(f"Error fetching product {product_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -187,44 +481,38 @@ async def get_product(product_id: str):
 @app.put("/api/products/{product_id}", response_model=Product, tags=["Products"])
 async def update_product(product_id: str, product_update: ProductUpdate):
     """Update a specific product"""
+    current_time = utc_now()
     try:
-        existing_product = products_collection.find_one({"id": product_id})
-        
-        if not existing_product:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Product with id {product_id} not found"
-            )
+        product_uuid = parse_product_id(product_id)
         
         # Only update fields that are provided
-        update_data = {}
-        for field, value in product_update.dict(exclude_unset=True).items():
-            if value is not None:
-                update_data[field] = value
+        update_data = product_update.model_dump(exclude_unset=True, exclude_none=True)
         
         if update_data:
-            update_data["updated_at"] = datetime.utcnow()
+            update_data["updated_at"] = current_time
             
-            result = products_collection.update_one(
-                {"id": product_id},
-                {"$set": update_data}
+            # Update and fetch the post-image in a single round-trip
+            updated_product = await products_collection.find_one_and_update(
+                {"id": product_uuid},
+                {"$set": update_data},
+                projection=PRODUCT_PROJECTION,
+                return_document=ReturnDocument.AFTER
             )
-            
-            if result.modified_count == 1:
-                updated_product = products_collection.find_one({"id": product_id})
-                return product_helper(updated_product)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to update product"
-                )
         else:
             # No updates provided, return existing product
-            return product_helper(existing_product)
+            updated_product = await products_collection.find_one({"id": product_uuid}, PRODUCT_PROJECTION)
+        
+        if not updated_product:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with id {product_id} not found"
+            )
+        
+        if update_data:
+            await invalidate_product_cache(product_uuid)
+        return updated_product
             
-    except HTTPException:
-        raise
-    except Exception as e:
+    except PyMongoError as e:
         logger.error(f"Error updating product {product_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -235,37 +523,39 @@ async def update_product(product_id: str, product_update: ProductUpdate):
 async def delete_product(product_id: str):
     """Delete a specific product"""
     try:
-        result = products_collection.delete_one({"id": product_id})
+        product_uuid = parse_product_id(product_id)
+        result = await products_collection.delete_one({"id": product_uuid})
         
         if result.deleted_count == 1:
+            await invalidate_product_cache(product_uuid)
             return None
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Product with id {product_id} not found"
             )
-    except HTTPException:
-        raise
-    except Exception as e:
+    except PyMongoError as e:
         logger.error(f"Error deleting product {product_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete product: {str(e)}"
         )
 
-@app.get("/api/products/category/{category}", response_model=List[Product], tags=["Products"])
-async def get_products_by_category(category: str, skip: int = 0, limit: int = 50):
+@app.get("/api/products/category/{category}", response_model=None, responses={200: {"model": List[Product]}}, tags=["Products"])
+@cache(expire=PRODUCT_LIST_CACHE_TTL, namespace="products:by-category")
+async def get_products_by_category(category: str, skip: int = 0, limit: int = Query(50, ge=0)):
     """Get products filtered by category"""
     try:
-        products = list(
-            products_collection.find({"category": {"$regex": category, "$options": "i"}})
+        cursor = (
+            products_collection.find({"category": category}, PRODUCT_PROJECTION, collation=CATEGORY_COLLATION)
             .skip(skip)
             .limit(limit)
-            .sort("created_at", -1)
+            .sort([("created_at", -1), ("id", -1)])
+            .batch_size(limit)
         )
         
-        return [product_helper(product) for product in products]
-    except Exception as e:
+        return await cursor.to_list(length=None)
+    except PyMongoError as e:
         logger.error(f"Error fetching products by category {category}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -274,4 +564,13 @@ async def get_products_by_category(category: str, skip: int = 0, limit: int = 50
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # Workers are separate processes, so uvicorn needs the app as an import string
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8001,
+        # "auto" picks uvloop and httptools when installed and falls back otherwise (uvloop has no Windows build)
+        loop="auto",
+        http="auto",
+        workers=WEB_CONCURRENCY
+    )
\ No newline at end of file
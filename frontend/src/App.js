@@ -27,7 +27,7 @@ function App() {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
       const data = await response.json();
-      setProducts(data);
+      setProducts(data.items);
       setError(null);
     } catch (err) {
       setError('Failed to fetch products: ' + err.message);
@@ -0,0 +1,303 @@
+import base64
+import re
+import sys
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import fakeredis
+import mongomock.collection
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+import server  # noqa: E402
+
+PRODUCT = {
+    "name": "Wireless Bluetooth Headphones",
+    "description": "Premium quality wireless headphones with noise cancellation",
+    "price": 129.99,
+    "category": "Electronics",
+    "stock_quantity": 50,
+    "image_url": "https://example.com/headphones.jpg"
+}
+
+
+def apply_collation(filter, collation):
+    """Emulate a case-insensitive collation by matching top-level strings with an anchored regex"""
+    if collation is None:
+        return filter
+    assert collation.document["strength"] <= 2
+    return {
+        field: re.compile(f"^{re.escape(value)}$", re.IGNORECASE) if isinstance(value, str) else value
+        for field, value in (filter or {}).items()
+    }
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # mongomock ignores uuidRepresentation, so skip its BSON check that rejects native UUIDs
+    monkeypatch.setattr(mongomock.collection, "BSON", None)
+    # mongomock ignores collation on find and rejects it on count_documents
+    find = mongomock.collection.Collection.find
+    count_documents = mongomock.collection.Collection.count_documents
+    monkeypatch.setattr(
+        mongomock.collection.Collection,
+        "find",
+        lambda self, filter=None, *args, collation=None, **kwargs: find(
+            self, apply_collation(filter, collation), *args, **kwargs
+        )
+    )
+    monkeypatch.setattr(
+        mongomock.collection.Collection,
+        "count_documents",
+        lambda self, filter, collation=None, **kwargs: count_documents(
+            self, apply_collation(filter, collation), **kwargs
+        )
+    )
+    monkeypatch.setattr(server, "AsyncIOMotorClient", AsyncMongoMockClient)
+    monkeypatch.setattr(
+        server,
+        "Redis",
+        SimpleNamespace(from_url=lambda url, **kwargs: fakeredis.aioredis.FakeRedis(**kwargs))
+    )
+    FastAPICache.reset()
+    server._product_cache.clear()
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+def create_product(client, **overrides):
+    response = client.post("/api/products", json={**PRODUCT, **overrides})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_update_invalidates_cached_reads(client):
+    product = create_product(client)
+    url = f"/api/products/{product['id']}"
+
+    # Prime the product and listing caches
+    assert client.get(url).json()["name"] == PRODUCT["name"]
+    assert client.get("/api/products").json()["items"][0]["name"] == PRODUCT["name"]
+
+    assert client.put(url, json={"name": "Renamed"}).status_code == 200
+
+    assert client.get(url).json()["name"] == "Renamed"
+    assert client.get("/api/products").json()["items"][0]["name"] == "Renamed"
+
+
+def test_delete_invalidates_cached_reads(client):
+    product = create_product(client)
+    url = f"/api/products/{product['id']}"
+    assert client.get(url).status_code == 200
+    assert client.get("/api/products").json()["total"] == 1
+
+    assert client.delete(url).status_code == 204
+
+    assert client.get(url).status_code == 404
+    assert client.get("/api/products").json()["items"] == []
+
+
+def test_create_invalidates_cached_listing(client):
+    assert client.get("/api/products").json()["items"] == []
+
+    create_product(client)
+
+    assert len(client.get("/api/products").json()["items"]) == 1
+
+
+def test_product_reads_are_not_cached_by_clients(client):
+    product = create_product(client)
+
+    for url in ("/api/products", f"/api/products/{product['id']}", "/api/products/category/Electronics"):
+        # Second request is served from the server-side cache
+        client.get(url)
+        assert client.get(url).headers["Cache-Control"] == "no-store"
+
+
+@pytest.mark.parametrize("spelling", [
+    lambda product_id: product_id.upper(),
+    lambda product_id: product_id.replace("-", ""),
+    lambda product_id: f"{{{product_id}}}",
+    lambda product_id: f"urn:uuid:{product_id}",
+])
+@pytest.mark.parametrize("local_cache", [False, True])
+def test_update_invalidates_any_spelling_of_the_id(client, monkeypatch, spelling, local_cache):
+    monkeypatch.setattr(server, "LOCAL_PRODUCT_CACHE_ENABLED", local_cache)
+    product = create_product(client)
+    url = f"/api/products/{spelling(product['id'])}"
+    assert client.get(url).json()["name"] == PRODUCT["name"]
+
+    assert client.put(f"/api/products/{product['id']}", json={"name": "Renamed"}).status_code == 200
+
+    assert client.get(url).json()["name"] == "Renamed"
+
+
+def test_local_product_cache_is_off_with_multiple_workers(client, monkeypatch):
+    monkeypatch.setattr(server, "LOCAL_PRODUCT_CACHE_ENABLED", False)
+    product = create_product(client)
+
+    assert client.get(f"/api/products/{product['id']}").status_code == 200
+
+    assert len(server._product_cache) == 0
+
+
+def test_local_product_cache_is_invalidated_with_one_worker(client, monkeypatch):
+    monkeypatch.setattr(server, "LOCAL_PRODUCT_CACHE_ENABLED", True)
+    product = create_product(client)
+    url = f"/api/products/{product['id']}"
+    assert client.get(url).json()["name"] == PRODUCT["name"]
+    assert product["id"] in server._product_cache
+
+    assert client.put(url, json={"name": "Renamed"}).status_code == 200
+    assert client.get(url).json()["name"] == "Renamed"
+
+    assert client.delete(url).status_code == 204
+    assert client.get(url).status_code == 404
+
+
+def test_bulk_create_reports_partial_failure_and_invalidates_listing(client, monkeypatch):
+    existing = create_product(client)
+    assert client.get("/api/products").json()["total"] == 1
+
+    new_ids = [uuid.uuid4(), uuid.UUID(existing["id"]), uuid.uuid4()]
+    monkeypatch.setattr(server.uuid, "uuid4", lambda: new_ids.pop(0))
+    response = client.post("/api/products/bulk", json=[PRODUCT, PRODUCT, PRODUCT])
+
+    assert response.status_code == 409
+    detail = response.json()["detail"]
+    assert detail["inserted_count"] == 2
+    assert len(detail["created_ids"]) == 2
+    assert existing["id"] not in detail["created_ids"]
+    assert [error["index"] for error in detail["errors"]] == [1]
+    assert client.get("/api/products").json()["total"] == 3
+
+
+def test_bulk_create_rejects_oversized_batches(client):
+    response = client.post("/api/products/bulk", json=[PRODUCT] * (server.MAX_BULK_PRODUCTS + 1))
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "too_long"
+
+
+def test_legacy_string_ids_are_migrated(client):
+    legacy_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+    client.portal.call(server.products_collection.insert_one, {
+        **PRODUCT, "id": legacy_id, "created_at": now, "updated_at": now
+    })
+
+    client.portal.call(server.migrate_legacy_product_ids)
+
+    assert client.get(f"/api/products/{legacy_id}").json()["id"] == legacy_id
+    assert client.put(f"/api/products/{legacy_id}", json={"name": "Renamed"}).json()["name"] == "Renamed"
+    assert client.delete(f"/api/products/{legacy_id}").status_code == 204
+
+
+def test_timestamps_are_serialized_identically_on_writes_and_reads(client):
+    created = create_product(client)
+    url = f"/api/products/{created['id']}"
+
+    # Second read is served from the Redis cache
+    for read in (client.get(url).json(), client.get(url).json(), client.get("/api/products").json()["items"][0]):
+        assert read["created_at"] == created["created_at"]
+        assert read["updated_at"] == created["updated_at"]
+
+    updated = client.put(url, json={"name": "Renamed"}).json()
+    assert updated["created_at"] == created["created_at"]
+    assert client.get(url).json()["updated_at"] == updated["updated_at"]
+
+
+def test_writes_expire_listings_by_bumping_the_list_version(client):
+    version_key = server.product_list_version_key()
+    create_product(client)
+    version = int(client.portal.call(server.redis_client.get, version_key))
+
+    create_product(client)
+
+    assert int(client.portal.call(server.redis_client.get, version_key)) == version + 1
+
+
+def test_total_is_reported_on_the_first_page_only(client):
+    assert client.post("/api/products/bulk", json=[PRODUCT] * 3).status_code == 201
+
+    first_page = client.get("/api/products", params={"limit": 2}).json()
+    assert first_page["total"] == 3
+
+    next_page = client.get("/api/products", params={"limit": 2, "cursor": first_page["next_cursor"]}).json()
+    assert next_page["total"] is None
+
+
+def test_keyset_pagination_walks_every_product_once(client):
+    # A bulk batch shares one created_at, so paging relies on the id tie-breaker
+    bulk_ids = [product["id"] for product in client.post("/api/products/bulk", json=[PRODUCT] * 5).json()]
+    single_ids = [create_product(client)["id"] for _ in range(2)]
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        page = client.get("/api/products", params=params).json()
+        assert len(page["items"]) <= 2
+        seen += page["items"]
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    seen_ids = [product["id"] for product in seen]
+    assert len(seen_ids) == len(set(seen_ids))
+    assert set(seen_ids) == set(bulk_ids + single_ids)
+    # Newest first, ties broken by descending id
+    positions = [(datetime.fromisoformat(product["created_at"]), uuid.UUID(product["id"])) for product in seen]
+    assert positions == sorted(positions, reverse=True)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    base64.urlsafe_b64encode(b'["2024-01-01T00:00:00+00:00"]').decode(),
+    base64.urlsafe_b64encode(b'["yesterday", "00000000-0000-0000-0000-000000000000"]').decode(),
+    base64.urlsafe_b64encode(b'["2024-01-01T00:00:00+00:00", "not-a-uuid"]').decode(),
+])
+def test_invalid_cursor_is_rejected(client, cursor):
+    response = client.get("/api/products", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+def test_category_pages_break_created_at_ties_by_id(client):
+    bulk_ids = [product["id"] for product in client.post("/api/products/bulk", json=[PRODUCT] * 5).json()]
+
+    seen = []
+    for skip in (0, 2, 4):
+        seen += client.get("/api/products/category/Electronics", params={"skip": skip, "limit": 2}).json()
+
+    assert [product["id"] for product in seen] == sorted(bulk_ids, key=uuid.UUID, reverse=True)
+
+
+@pytest.mark.parametrize("category", ["Electronics", "electronics", "ELECTRONICS"])
+def test_category_filters_match_case_insensitively(client, category):
+    product = create_product(client)
+    create_product(client, category="Books")
+
+    listing = client.get("/api/products", params={"category": category}).json()
+    assert [item["id"] for item in listing["items"]] == [product["id"]]
+    assert listing["total"] == 1
+
+    by_category = client.get(f"/api/products/category/{category}").json()
+    assert [item["id"] for item in by_category] == [product["id"]]
+
+
+def test_category_filters_no_longer_match_substrings(client):
+    create_product(client)
+
+    listing = client.get("/api/products", params={"category": "elec"}).json()
+    assert listing["items"] == []
+    assert listing["total"] == 0
+
+    assert client.get("/api/products/category/elec").json() == []